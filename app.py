@@ -5,6 +5,7 @@ import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import numpy as np
 import math
+import re
 
 # Page configuration
 st.set_page_config(
@@ -218,13 +219,232 @@ def load_power_index_data():
     df_forecast = pd.DataFrame(forecast_data)
     return pd.concat([df, df_forecast]).reset_index(drop=True)
 
+# --- TIMEFRAME INTERVAL INDEX ---
+def parse_timeframe(timeframe):
+    """Parse a timeframe such as "2026-2028" or "2027" into an inclusive (start, end) year pair."""
+    match = re.fullmatch(r"\s*(\d{4})\s*(?:[-–]\s*(\d{4})\s*)?", str(timeframe))
+    if not match:
+        raise ValueError(f"Unrecognised forecast timeframe: {timeframe!r}")
+    start = int(match.group(1))
+    end = int(match.group(2) or start)
+    if end < start:
+        raise ValueError(f"Forecast timeframe ends before it starts: {timeframe!r}")
+    return start, end
+
+class TimeframeIndex:
+    """Interval index over forecast timeframes backed by sorted endpoint arrays.
+
+    A window [lo, hi] misses an interval only if the interval starts after hi or ends
+    before lo, and those two cases are disjoint. Overlap and stabbing counts are
+    therefore two binary searches over the sorted starts/ends: O(log n) per query.
+    Timeframes that cannot be parsed are left out of the index and listed in `unparsed`.
+    """
+    def __init__(self, timeframes):
+        bounds, positions, self.unparsed = [], [], []
+        for pos, timeframe in enumerate(timeframes):
+            try:
+                bounds.append(parse_timeframe(timeframe))
+            except ValueError:
+                self.unparsed.append(timeframe)
+                continue
+            positions.append(pos)
+        self.size = len(positions) + len(self.unparsed)
+        self.positions = np.array(positions, dtype=np.int64)
+        bounds = np.array(bounds, dtype=np.int64).reshape(-1, 2)
+        self.starts = bounds[:, 0]
+        self.ends = bounds[:, 1]
+        self.sorted_starts = np.sort(self.starts)
+        self.sorted_ends = np.sort(self.ends)
+
+    def __len__(self):
+        return len(self.starts)
+
+    @property
+    def year_span(self):
+        if len(self) == 0:
+            return None
+        return int(self.sorted_starts[0]), int(self.sorted_ends[-1])
+
+    def count_overlapping(self, lo, hi):
+        """Number of timeframes overlapping [lo, hi]. Accepts scalars or arrays of bounds."""
+        return (np.searchsorted(self.sorted_starts, hi, side='right')
+                - np.searchsorted(self.sorted_ends, lo, side='left'))
+
+    def count_live(self, year):
+        """Stabbing query: number of timeframes that contain `year`."""
+        return self.count_overlapping(year, year)
+
+    def count_resolving(self, lo, hi):
+        """Number of timeframes whose final year falls in [lo, hi]."""
+        return (np.searchsorted(self.sorted_ends, hi, side='right')
+                - np.searchsorted(self.sorted_ends, lo, side='left'))
+
+    def overlap_mask(self, lo, hi):
+        """Boolean mask, aligned with the input order, of timeframes overlapping [lo, hi].
+
+        Unparsed timeframes are always included so those forecasts stay visible.
+        """
+        mask = np.ones(self.size, dtype=bool)
+        mask[self.positions] = (self.starts <= hi) & (self.ends >= lo)
+        return mask
+
+    def timeline(self, years):
+        """Live and resolving counts for every year in `years`, one vectorised search per column."""
+        years = np.asarray(years, dtype=np.int64)
+        return pd.DataFrame({
+            'Year': years,
+            'Live': self.count_live(years),
+            'Resolving': self.count_resolving(years, years),
+        })
+
+@st.cache_resource
+def build_timeframe_index(df):
+    return TimeframeIndex(df['timeframe'])
+
+# --- SSA DEBT & TRADE CUBE ---
+# The 48 Sub-Saharan economies (World Bank grouping) with ISO-3 codes for mapping
+SSA_COUNTRIES = {
+    "West Africa": [("BEN", "Benin"), ("BFA", "Burkina Faso"), ("CPV", "Cabo Verde"), ("CIV", "Côte d'Ivoire"),
+                    ("GMB", "Gambia"), ("GHA", "Ghana"), ("GIN", "Guinea"), ("GNB", "Guinea-Bissau"),
+                    ("LBR", "Liberia"), ("MLI", "Mali"), ("MRT", "Mauritania"), ("NER", "Niger"),
+                    ("NGA", "Nigeria"), ("SEN", "Senegal"), ("SLE", "Sierra Leone"), ("TGO", "Togo")],
+    "East Africa": [("BDI", "Burundi"), ("COM", "Comoros"), ("ERI", "Eritrea"), ("ETH", "Ethiopia"),
+                    ("KEN", "Kenya"), ("MDG", "Madagascar"), ("MUS", "Mauritius"), ("RWA", "Rwanda"),
+                    ("SYC", "Seychelles"), ("SOM", "Somalia"), ("SSD", "South Sudan"), ("SDN", "Sudan"),
+                    ("TZA", "Tanzania"), ("UGA", "Uganda")],
+    "Central Africa": [("CMR", "Cameroon"), ("CAF", "Central African Republic"), ("TCD", "Chad"),
+                       ("COG", "Congo, Rep."), ("COD", "Congo, Dem. Rep."), ("GNQ", "Equatorial Guinea"),
+                       ("GAB", "Gabon"), ("STP", "São Tomé and Príncipe")],
+    "Southern Africa": [("AGO", "Angola"), ("BWA", "Botswana"), ("SWZ", "Eswatini"), ("LSO", "Lesotho"),
+                        ("MWI", "Malawi"), ("MOZ", "Mozambique"), ("NAM", "Namibia"), ("ZAF", "South Africa"),
+                        ("ZMB", "Zambia"), ("ZWE", "Zimbabwe")],
+}
+# Nominal GDP, 2023, current US$ billions (World Bank WDI NY.GDP.MKTP.CD, rounded; Eritrea and
+# South Sudan from IMF WEO estimates). Used to size each economy's share of SSA debt and trade.
+SSA_GDP_2023 = {
+    "BEN": 19.7, "BFA": 20.3, "CPV": 2.6, "CIV": 78.9, "GMB": 2.3, "GHA": 76.4, "GIN": 23.2, "GNB": 2.0,
+    "LBR": 4.3, "MLI": 20.7, "MRT": 10.4, "NER": 16.8, "NGA": 363.8, "SEN": 31.0, "SLE": 3.8, "TGO": 9.2,
+    "BDI": 2.6, "COM": 1.3, "ERI": 2.3, "ETH": 159.7, "KEN": 107.4, "MDG": 16.0, "MUS": 14.4, "RWA": 14.1,
+    "SYC": 2.1, "SOM": 11.0, "SSD": 6.3, "SDN": 30.0, "TZA": 79.1, "UGA": 49.3,
+    "CMR": 49.3, "CAF": 2.6, "TCD": 13.1, "COG": 15.3, "COD": 66.4, "GNQ": 12.1, "GAB": 19.3, "STP": 0.6,
+    "AGO": 84.7, "BWA": 19.4, "SWZ": 4.6, "LSO": 2.1, "MWI": 12.7, "MOZ": 20.6, "NAM": 12.4, "ZAF": 377.8,
+    "ZMB": 27.6, "ZWE": 35.2,
+}
+# Lender -> lender group
+SSA_LENDERS = {"China": "China", "USA": "Western Bilateral", "EU": "Western Bilateral",
+               "Multilateral": "Multilateral", "Private Creditors": "Private Creditors"}
+# Instruments are ordered so debt and trade each form a contiguous block (slices stay views)
+SSA_INSTRUMENTS = ["Concessional Loans", "Commercial Loans", "Bonds", "Exports", "Imports"]
+SSA_MEASURES = {"External Debt": slice(0, 3), "Trade": slice(3, 5)}
+# Sourced headline series: China's share (%) of SSA external public debt
+CHINA_DEBT_SHARE = {2015: 15, 2018: 25, 2020: 36, 2022: 38, 2024: 40}
+# Island states too small to render reliably on the choropleth
+SSA_ISLAND_STATES = ["CPV", "COM", "MUS", "SYC", "STP"]
+
+class DebtTradeCube:
+    """Dense lender x country x year x instrument array with precomputed rollups.
+
+    The cube is read-only and shared across reruns; slicing a single lender, country
+    or year returns a NumPy view rather than a re-pivoted DataFrame.
+    """
+    def __init__(self, values, lenders, lender_groups, countries, years, instruments, measures):
+        self.lenders = list(lenders)
+        self.lender_groups = list(dict.fromkeys(lender_groups[l] for l in self.lenders))
+        self.countries = countries.reset_index(drop=True)
+        self.regions = list(dict.fromkeys(self.countries['region']))
+        self.years = np.asarray(years, dtype=np.int64)
+        self.instruments = list(instruments)
+        self.measures = dict(measures)
+        self.values = values
+        self._country_pos = {iso: i for i, iso in enumerate(self.countries['iso3'])}
+        self._year_pos = {int(y): i for i, y in enumerate(self.years)}
+
+        # One-hot membership matrices used to fold countries into regions and lenders into groups
+        region_matrix = (self.countries['region'].to_numpy()[:, None] == np.array(self.regions)[None, :]).astype(float)
+        group_matrix = (np.array([lender_groups[l] for l in self.lenders])[:, None] == np.array(self.lender_groups)[None, :]).astype(float)
+
+        # --- Precomputed rollups ---
+        self.by_country = values.sum(axis=0)                                              # (country, year, instrument)
+        self.by_lender_group = np.einsum('lcyi,lg->gcyi', values, group_matrix)           # (group, country, year, instrument)
+        self.by_group_region = np.einsum('gcyi,cr->gryi', self.by_lender_group, region_matrix)  # (group, region, year, instrument)
+        self.by_group_year = self.by_group_region.sum(axis=1)                             # (group, year, instrument)
+        self.by_region_year = self.by_group_region.sum(axis=0)                            # (region, year, instrument)
+
+        for arr in (self.values, self.by_country, self.by_lender_group,
+                    self.by_group_region, self.by_group_year, self.by_region_year):
+            arr.flags.writeable = False
+
+    def country(self, iso3):
+        """View of one borrower: (lender, year, instrument)."""
+        return self.values[:, self._country_pos[iso3]]
+
+    def year_index(self, year):
+        return self._year_pos[int(year)]
+
+    def measure(self, arr, measure):
+        """Total a cube or rollup over the instruments of `measure` (last axis)."""
+        return arr[..., self.measures[measure]].sum(axis=-1)
+
+@st.cache_resource
+def build_ssa_cube(df_trade):
+    """Illustrative SSA debt and trade cube, calibrated to the headline aggregates used elsewhere.
+
+    Country sizes come from SSA_GDP_2023; lender totals, splits and instrument mixes are
+    placeholder assumptions (marked below) until country-level creditor data is sourced.
+    """
+    countries = pd.DataFrame(
+        [{"iso3": iso, "country": name, "region": region}
+         for region, members in SSA_COUNTRIES.items() for iso, name in members]
+    )
+    lenders = list(SSA_LENDERS)
+    years = np.arange(2015, 2025)
+    n_lenders, n_countries, n_years = len(lenders), len(countries), len(years)
+    rng = np.random.default_rng(42)
+
+    # Country size from GDP; lender-specific exposure is seeded noise around it, drifting year on year
+    country_scale = countries['iso3'].map(SSA_GDP_2023).to_numpy(dtype=float)
+    exposure = rng.lognormal(0.0, 0.3, (n_lenders, n_countries, 1)) * rng.lognormal(0.0, 0.05, (n_lenders, n_countries, n_years))
+    weights = country_scale[None, :, None] * exposure
+    weights /= weights.sum(axis=1, keepdims=True)
+
+    # External public debt ($B): China's share follows the headline series, the rest split by fixed shares.
+    # PLACEHOLDER ASSUMPTION: $380B in 2015 growing 6% a year.
+    total_debt = 380 * 1.06 ** np.arange(n_years)
+    china_share = np.interp(years, list(CHINA_DEBT_SHARE), list(CHINA_DEBT_SHARE.values())) / 100
+    # PLACEHOLDER ASSUMPTION: split of the non-China share across the other lenders
+    other_split = {"USA": 0.10, "EU": 0.15, "Multilateral": 0.45, "Private Creditors": 0.30}
+    lender_debt = np.array([
+        total_debt * (china_share if l == "China" else (1 - china_share) * other_split[l]) for l in lenders
+    ])
+    # PLACEHOLDER ASSUMPTION: instrument mix (concessional loans, commercial loans, bonds) per lender
+    debt_mix = {"China": [0.20, 0.75, 0.05], "USA": [0.70, 0.30, 0.00], "EU": [0.65, 0.35, 0.00],
+                "Multilateral": [0.90, 0.10, 0.00], "Private Creditors": [0.00, 0.25, 0.75]}
+
+    # Trade ($B) with the three major powers follows the historical trade series; SSA export share of each
+    trade_cols = {"China": "China", "USA": "US", "EU": "EU"}
+    hist_trade = df_trade[df_trade['year'] <= 2024]
+    # PLACEHOLDER ASSUMPTION: share of each partner's trade that is SSA exports (the rest is imports)
+    export_share = {"China": 0.45, "USA": 0.50, "EU": 0.50}
+
+    values = np.zeros((n_lenders, n_countries, n_years, len(SSA_INSTRUMENTS)))
+    for li, lender in enumerate(lenders):
+        values[li, :, :, :3] = (weights[li] * lender_debt[li])[:, :, None] * np.array(debt_mix[lender])
+        if lender in trade_cols:
+            lender_trade = np.interp(years, hist_trade['year'], hist_trade[trade_cols[lender]])
+            values[li, :, :, 3:] = (weights[li] * lender_trade)[:, :, None] * np.array([export_share[lender], 1 - export_share[lender]])
+
+    return DebtTradeCube(values, lenders, SSA_LENDERS, countries, years, SSA_INSTRUMENTS, SSA_MEASURES)
+
 # Load all dataframes
 df_forecasts = load_forecast_data()
 df_trade = load_trade_data()
 df_power = load_power_index_data()
+timeframe_index = build_timeframe_index(df_forecasts)
+ssa_cube = build_ssa_cube(df_trade)
 
 # Plotting color map -- KEY FIX: Changed 'US' to 'USA' to prevent KeyError
 PLOT_COLORS = {'China': COMPANY_COLORS['red_primary'], 'USA': COMPANY_COLORS['medium_grey'], 'EU': COMPANY_COLORS['light_grey'], 'Nigeria': '#D3D3D3'}
+SSA_LENDER_COLORS = {'China': COMPANY_COLORS['red_primary'], 'USA': COMPANY_COLORS['medium_grey'], 'EU': COMPANY_COLORS['light_grey'], 'Multilateral': '#D3D3D3', 'Private Creditors': COMPANY_COLORS['red_accent']}
 
 # --- UI LAYOUT ---
 st.markdown('<h1 class="main-header">Modern Mercantilism: Decoding the New Global Order</h1>', unsafe_allow_html=True)
@@ -368,6 +588,40 @@ with tab2:
             label_visibility="collapsed"
         )
 
+        # --- 4. Timeframe Filter (only when the forecasts span more than one year) ---
+        year_span = timeframe_index.year_span
+        timeframe_window = None
+        if year_span is not None and year_span[0] < year_span[1]:
+            st.markdown("---")
+            st.markdown("#### 4. Filter by Timeframe")
+            st.markdown("<p style='font-size: 0.9rem; color: #AAAAAA;'>Show forecasts whose timeframe is <b>live at any point</b> during the selected window.</p>", unsafe_allow_html=True)
+            first_year, last_year = year_span
+            timeframe_window = st.slider(
+                "Timeframe Window", min_value=first_year, max_value=last_year, value=(first_year, last_year),
+                label_visibility="collapsed"
+            )
+
+    if timeframe_index.unparsed:
+        unparsed_list = ", ".join(f"'{t}'" for t in timeframe_index.unparsed)
+        st.warning(f"Some forecast timeframes could not be read as 'YYYY' or 'YYYY-YYYY' and are excluded from the timeline (they stay in the table): {unparsed_list}")
+
+    # --- RESOLUTION TIMELINE ---
+    if timeframe_window is not None:
+        st.markdown("### 🗓️ Resolution Timeline (All Forecasts)")
+        st.markdown(f"<p style='font-size: 0.9rem; color: #AAAAAA;'>Covers all {len(timeframe_index)} forecasts with a recognised timeframe; only the timeframe window applies here. The cycle, category and probability filters apply to the table below.</p>", unsafe_allow_html=True)
+        timeline_df = timeframe_index.timeline(range(first_year, last_year + 1))
+        fig_timeline = go.Figure()
+        fig_timeline.add_trace(go.Bar(x=timeline_df['Year'], y=timeline_df['Resolving'], name='Resolving', marker_color=COMPANY_COLORS['red_primary']))
+        fig_timeline.add_trace(go.Scatter(x=timeline_df['Year'], y=timeline_df['Live'], name='Live', mode='lines+markers', line=dict(color=COMPANY_COLORS['light_grey'], width=3)))
+        fig_timeline.add_vrect(x0=timeframe_window[0] - 0.5, x1=timeframe_window[1] + 0.5, fillcolor=COMPANY_COLORS['medium_grey'], opacity=0.25, line_width=0)
+        fig_timeline.update_layout(xaxis_title="Year", yaxis_title="Forecasts", xaxis=dict(dtick=1), template="plotly_dark", height=350, paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)')
+        st.plotly_chart(fig_timeline, use_container_width=True)
+        window_live = timeframe_index.count_overlapping(*timeframe_window)
+        window_resolving = timeframe_index.count_resolving(*timeframe_window)
+        live_label = "forecast is" if window_live == 1 else "forecasts are"
+        resolving_label = "resolves" if window_resolving == 1 else "resolve"
+        st.markdown(f"<p style='font-size: 0.9rem; color: #AAAAAA;'><b>{window_live}</b> {live_label} live and <b>{window_resolving}</b> {resolving_label} during {timeframe_window[0]}–{timeframe_window[1]}.</p>", unsafe_allow_html=True)
+
     # --- FILTERING LOGIC ---
     if not selected_core_cycles:
         cycle_filtered_df = df_forecasts[df_forecasts['cycle_link'].isnull()]
@@ -376,9 +630,14 @@ with tab2:
         cycle_filtered_df = df_forecasts[df_forecasts['cycle_link'].str.contains(pattern, case=False, na=False)]
 
     # The rest of the logic remains the same, as `selected_categories` now contains the correct detailed list
+    if timeframe_window is not None:
+        in_window = pd.Series(timeframe_index.overlap_mask(*timeframe_window), index=df_forecasts.index)
+    else:
+        in_window = pd.Series(True, index=df_forecasts.index)
     final_filtered_df = cycle_filtered_df[
         (cycle_filtered_df['category'].isin(selected_categories)) &
-        (cycle_filtered_df['probability'] >= min_prob_selection)
+        (cycle_filtered_df['probability'] >= min_prob_selection) &
+        (in_window.loc[cycle_filtered_df.index])
     ].copy()
     
     # --- INTERACTIVE FORECAST TABLE & COMPARISON FEATURE ---
@@ -512,18 +771,17 @@ with tab5:
 
     # --- REVISED: Changed to a 100% Stacked Bar Chart for Debt Composition ---
     st.markdown("### 📊 Composition of SSA External Public Debt")
-    debt_data = pd.DataFrame({'Year': [2015, 2018, 2020, 2022, 2024], 'China_Debt_Share': [15, 25, 36, 38, 40]})
-    debt_data['Other_Lenders_Share'] = 100 - debt_data['China_Debt_Share']
-
-    # Melt the dataframe to make it suitable for a stacked bar chart
-    debt_melted = debt_data.melt(
-        id_vars='Year', 
-        value_vars=['China_Debt_Share', 'Other_Lenders_Share'],
-        var_name='Lender',
-        value_name='Share'
-    )
-    # Clean up the lender names
-    debt_melted['Lender'] = debt_melted['Lender'].replace({'China_Debt_Share': 'China', 'Other_Lenders_Share': 'Other Lenders'})
+    # Served straight from the precomputed (lender group, year) rollup of the debt cube,
+    # limited to the years with sourced figures (the cube interpolates the rest)
+    sourced_years = np.isin(ssa_cube.years, list(CHINA_DEBT_SHARE))
+    group_debt = ssa_cube.measure(ssa_cube.by_group_year[:, sourced_years], "External Debt")
+    china_share = 100 * group_debt[ssa_cube.lender_groups.index("China")] / group_debt.sum(axis=0)
+    n_years = int(sourced_years.sum())
+    debt_melted = pd.DataFrame({
+        'Year': np.tile(ssa_cube.years[sourced_years], 2),
+        'Lender': ['China'] * n_years + ['Other Lenders'] * n_years,
+        'Share': np.concatenate([china_share, 100 - china_share])
+    })
     
     fig_debt_stacked = px.bar(
         debt_melted,
@@ -551,6 +809,54 @@ with tab5:
     )
     st.plotly_chart(fig_debt_stacked, use_container_width=True)
 
+    # --- Country-level drilldown backed by the SSA debt & trade cube ---
+    st.markdown("### 🗺️ Country Drilldown: Debt & Trade Across 48 SSA Economies")
+    st.markdown("<p style='font-size: 0.9rem; color: #AAAAAA;'>Illustrative lender × country × year × instrument data: country sizes follow 2023 GDP and totals are calibrated to the headline debt and trade series above, but lender splits and instrument mixes are placeholder assumptions.</p>", unsafe_allow_html=True)
+    c1, c2, c3 = st.columns(3)
+    cube_measure = c1.radio("Measure", list(ssa_cube.measures), horizontal=True)
+    cube_group = c2.selectbox("Lender", ["All Lenders"] + ssa_cube.lender_groups)
+    cube_year = c3.select_slider("Year", options=ssa_cube.years.tolist(), value=int(ssa_cube.years[-1]))
+    year_idx = ssa_cube.year_index(cube_year)
+
+    if cube_group == "All Lenders":
+        country_values = ssa_cube.measure(ssa_cube.by_country[:, year_idx], cube_measure)
+        region_values = ssa_cube.measure(ssa_cube.by_region_year[:, year_idx], cube_measure)
+    else:
+        group_idx = ssa_cube.lender_groups.index(cube_group)
+        country_values = ssa_cube.measure(ssa_cube.by_lender_group[group_idx, :, year_idx], cube_measure)
+        region_values = ssa_cube.measure(ssa_cube.by_group_region[group_idx, :, year_idx], cube_measure)
+
+    col1, col2 = st.columns([2, 1])
+    with col1:
+        fig_map = px.choropleth(
+            ssa_cube.countries.assign(value=country_values),
+            locations='iso3', color='value', hover_name='country',
+            color_continuous_scale='Reds', scope='africa',
+            labels={'value': f"{cube_measure} ($B)"},
+            title=f"{cube_measure} by Country, {cube_group} ({cube_year}, Illustrative)"
+        )
+        fig_map.update_geos(bgcolor='rgba(0,0,0,0)', showframe=False, showcountries=True, resolution=50)
+        fig_map.update_layout(height=500, template="plotly_dark", paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)', margin=dict(l=0, r=0, t=60, b=0))
+        st.plotly_chart(fig_map, use_container_width=True)
+        island_states = ssa_cube.countries['iso3'].isin(SSA_ISLAND_STATES).to_numpy()
+        island_notes = ", ".join(f"{name} ${value:,.1f}B" for name, value in zip(ssa_cube.countries['country'][island_states], country_values[island_states]))
+        st.markdown(f"<p style='font-size: 0.9rem; color: #AAAAAA;'>Island states that may not render on the map: {island_notes}.</p>", unsafe_allow_html=True)
+    with col2:
+        fig_region = px.bar(x=region_values, y=ssa_cube.regions, orientation='h', labels={'x': f"{cube_measure} ($B)", 'y': 'Region'}, title=f"By Region ({cube_year}, Illustrative)", text_auto='.3s')
+        fig_region.update_traces(marker_color=COMPANY_COLORS['red_primary'], textposition='outside')
+        fig_region.update_layout(height=500, template="plotly_dark", paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)')
+        st.plotly_chart(fig_region, use_container_width=True)
+
+    country_names = dict(zip(ssa_cube.countries['iso3'], ssa_cube.countries['country']))
+    drill_iso = st.selectbox("Select Country", list(country_names), format_func=country_names.get, index=list(country_names).index("NGA"))
+    country_view = ssa_cube.measure(ssa_cube.country(drill_iso), cube_measure)  # (lender, year)
+    fig_country = go.Figure()
+    for li, lender in enumerate(ssa_cube.lenders):
+        if country_view[li].any():
+            fig_country.add_trace(go.Bar(x=ssa_cube.years, y=country_view[li], name=lender, marker_color=SSA_LENDER_COLORS[lender]))
+    fig_country.update_layout(barmode='stack', title=f"{country_names[drill_iso]}: {cube_measure} by Lender/Partner (Illustrative)", xaxis_title="Year", yaxis_title=f"{cube_measure} ($B)", template="plotly_dark", height=400, paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)', legend_title_text='Lender')
+    st.plotly_chart(fig_country, use_container_width=True)
+
 
 # --- PAGE 6: CAUSAL LOOPS ---
 with tab6: